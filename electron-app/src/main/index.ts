@@ -51,6 +51,8 @@ let reconnectLoopRunning = false;
 let ipcRegistered = false;
 let pipeGuardsRegistered = false;
 let recordingActive = false;
+// Segments streamed back (RESULT_PARTIAL) for the transcription in flight.
+let partialTranscript = "";
 let wakeAutoStopTimer: NodeJS.Timeout | null = null;
 let sttReloadInProgress = false;
 
@@ -247,6 +249,7 @@ function stopRecording(
     return;
   }
 
+  partialTranscript = "";
   setRendererStatus("transcribing");
   playRendererCue("stop");
   setRendererTranscript(
@@ -331,7 +334,15 @@ function createWsClient(): SttWebSocketClient {
       }
       stopRecording(reason === "silence" ? "wake-silence" : "wake-timeout");
     },
+    onPartialResult: ({ text }) => {
+      partialTranscript += text;
+      const preview = partialTranscript.trim();
+      if (preview) {
+        setRendererTranscript(preview, "transcribing");
+      }
+    },
     onResult: async ({ text, meta }) => {
+      partialTranscript = "";
       recordingActive = false;
       clearWakeAutoStopTimer();
       await handleOutput(text, appConfig.outputMode);
@@ -512,11 +523,14 @@ function registerForceEndHotkey(): void {
   registeredForceEndHotkey = nextHotkey;
 }
 
-async function queryDevices() {
+async function queryDevices(refresh = false) {
   if (!listDevicesCommand) {
     return { microphones: [], systemAudio: [] };
   }
-  return listAudioDevices(listDevicesCommand, listDevicesArgs);
+  // Passive listings may be served from the helper's short-lived cache; an explicit
+  // refresh must re-enumerate so newly plugged devices show up immediately.
+  const args = refresh ? [...listDevicesArgs, "--refresh"] : listDevicesArgs;
+  return listAudioDevices(listDevicesCommand, args);
 }
 
 function resolveServiceCommands(): void {
@@ -704,7 +718,7 @@ function registerIpcHandlers(): void {
   });
 
   ipcMain.handle("devices:list", async () => {
-    return queryDevices();
+    return queryDevices(true);
   });
 
   ipcMain.handle("settings:save", async (_event, payload: unknown) => {
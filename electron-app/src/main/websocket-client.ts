@@ -8,6 +8,10 @@ export interface ResultMessage {
   };
 }
 
+export interface PartialResultMessage {
+  text: string;
+}
+
 export interface ErrorMessage {
   code: string;
   message: string;
@@ -17,6 +21,7 @@ type MessageHandler = {
   onReady: () => void;
   onWake: (payload: { wake_word?: string; heard?: string }) => void;
   onAutoStop: (payload: { reason?: string }) => void;
+  onPartialResult: (message: PartialResultMessage) => void;
   onResult: (message: ResultMessage) => void;
   onError: (message: ErrorMessage) => void;
   onClose: () => void;
@@ -73,7 +78,8 @@ export class SttWebSocketClient {
 
   private connectOnce(): Promise<void> {
     return new Promise((resolve, reject) => {
-      const ws = new WebSocket(this.url);
+      // Local, trusted channel: frames from the STT service needn't be re-validated as UTF-8.
+      const ws = new WebSocket(this.url, { skipUTF8Validation: true });
       let settled = false;
       let opened = false;
 
@@ -104,6 +110,12 @@ export class SttWebSocketClient {
           });
           return;
         }
+        if (kind === "RESULT_PARTIAL") {
+          this.handlers.onPartialResult({
+            text: String(payload.text ?? ""),
+          });
+          return;
+        }
         if (kind === "RESULT") {
           this.handlers.onResult({
             text: String(payload.text ?? ""),
@@ -146,11 +158,11 @@ export class SttWebSocketClient {
     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
       return;
     }
-    if (!payload || Object.keys(payload).length === 0) {
-      this.ws.send(type);
-      return;
-    }
-    this.ws.send(JSON.stringify({ type, ...payload }));
+    const body =
+      !payload || Object.keys(payload).length === 0 ? type : JSON.stringify({ type, ...payload });
+    // Binary frames skip the STT server's strict UTF-8 validation of text frames;
+    // it parses both kinds the same way.
+    this.ws.send(Buffer.from(body, "utf8"));
   }
 
   close(): void {
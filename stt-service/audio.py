@@ -1,11 +1,64 @@
 from __future__ import annotations
 
 import inspect
+import math
+import re
 import threading
+from typing import Any, Callable
 
 import numpy as np
 import sounddevice as sd
 
+# Initial recording arena size; it doubles whenever a recording outgrows it.
+_RECORD_ARENA_INITIAL_SECONDS = 30
+
+# Used when PortAudio reports no low-latency figure for the device.
+_FALLBACK_LOW_LATENCY_S = 0.01
+_MIN_BLOCKSIZE = 64
+
+# Extra ring slots beyond the largest read window (plus one max block). Readers hold
+# lock-free views, so the writer must be able to run this far ahead before it reaches
+# the oldest sample a full-window reader may still be copying.
+_RING_HEADROOM_MS = 250
+
+# Capture is stored as 16-bit PCM and only widened to float32 when handed out.
+_PCM16_SCALE = 1.0 / 32768.0
+
+# (floor index, next index, fraction, int16 output, int16 scratch, float32 scratch)
+# for one input block size.
+_ResampleTable = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Input devices whose (casefolded) names suggest they capture system playback.
+_SYSTEM_CAPTURE_NAME_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "stereo mix",
+            "loopback",
+            "what u hear",
+            "monitor",
+            "voicemeeter out",
+            "cable output",
+            "mix out",
+        )
+    )
+)
+
+# Loopback support differs between sounddevice/PortAudio builds; probe it once per process.
+_RAW_INPUT_STREAM_HAS_LOOPBACK = "loopback" in inspect.signature(sd.RawInputStream).parameters
+_HAS_WASAPI_SETTINGS = hasattr(sd, "WasapiSettings")
+_WASAPI_SETTINGS_HAS_LOOPBACK = (
+    _HAS_WASAPI_SETTINGS and "loopback" in inspect.signature(sd.WasapiSettings).parameters
+)
+
+
+def _next_pow2(value: int) -> int:
+    return 1 << max(0, value - 1).bit_length()
+
+
+def _pcm16_to_float32(samples: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    return np.multiply(samples, _PCM16_SCALE, out=out, dtype=np.float32)
+
 
 class RingBufferAudioCapture:
     def __init__(
@@ -30,19 +83,53 @@ class RingBufferAudioCapture:
         self.capture_source = capture_source
         self.input_device = input_device
         self.system_audio_device = system_audio_device
-
-        self._ring = np.zeros((self.ring_buffer_samples, self.channels), dtype=np.float32)
-        self._write_idx = 0
-        self._filled = 0
-
+        self._max_blocksize = max(_MIN_BLOCKSIZE, self.pre_buffer_samples // 2)
+
+        # Readable windows are at most ring_buffer_samples long; the physical ring is
+        # larger by the headroom so a callback never writes into a window being read.
+        self._ring_headroom = int(sample_rate * _RING_HEADROOM_MS / 1000)
+        self._ring_capacity = self.ring_buffer_samples + self._ring_headroom + self._max_blocksize
+        # Mono ring stored twice back to back (backing[i] == backing[i + capacity]) so any
+        # window of up to `capacity` samples is one contiguous slice, wrap or not.
+        self._ring_backing = np.zeros(2 * self._ring_capacity, dtype=np.int16)
+        # Single-producer/single-consumer ring: only the audio callback advances this
+        # monotonic sample counter, published with one int store after the ring copy.
+        # Readers snapshot it once and derive the write index and fill level from it.
+        self._total_written = 0
+
+        # Guards recording state only; ring writes never take it.
         self._lock = threading.Lock()
         self._recording = False
-        self._recording_chunks: list[np.ndarray] = []
-        self._frozen_prefix = np.zeros((0, self.channels), dtype=np.float32)
-        self._stream: sd.InputStream | None = None
+        self._record_from = 0
+        self._record_buf = np.empty(
+            (sample_rate * _RECORD_ARENA_INITIAL_SECONDS, self.channels),
+            dtype=np.int16,
+        )
+        # The pre-buffer prefix is copied to the front of the arena when recording begins.
+        self._record_write_pos = 0
+        self._stream: sd.RawInputStream | None = None
         self._stream_sample_rate = float(sample_rate)
+        self._needs_resample = False
+        # Callback body specialized for the current stream layout; rebuilt when it changes.
+        self._ingest: Callable[[Any], None] | None = None
+        self._ingest_frames = 0
+        # Downmix sums channels in int32 scratch, then writes the int16 average to out.
+        self._downmix_scratch: np.ndarray | None = None
+        self._downmix_out: np.ndarray | None = None
+        # Linear-interpolation tables keyed by input block size; rates are fixed per stream.
+        self._resample_tables: dict[int, _ResampleTable] = {}
+        # PortAudio device enumeration is slow; snapshot it once per start().
+        self._devices_cache: list[dict] = []
+        self._hostapis_cache: list[dict] = []
+        self._hostapi_name_cache: dict[int, str] = {}
+        # Casefolded device names by index, and name -> indices in enumeration order.
+        self._device_names_cf: list[str] = []
+        self._name_to_indices: dict[str, list[int]] = {}
 
     def start(self) -> None:
+        self._resample_tables.clear()
+        self._ingest = None
+        self._refresh_device_cache()
         if self.capture_source == "system-audio":
             self._start_system_audio_stream()
             return
@@ -54,15 +141,16 @@ class RingBufferAudioCapture:
             need_input=True,
             need_output=False,
         )
-        self._stream = sd.InputStream(
+        self._stream = sd.RawInputStream(
             device=device_index,
             samplerate=self.sample_rate,
             channels=self.requested_channels,
-            dtype="float32",
+            dtype="int16",
             callback=self._audio_callback,
+            **self._stream_timing(device_index, self.sample_rate),
         )
+        self._set_stream_sample_rate(self.sample_rate)
         self._stream.start()
-        self._stream_sample_rate = float(self.sample_rate)
 
     def _start_system_audio_stream(self) -> None:
         device_index = self._resolve_device_index(
@@ -80,66 +168,70 @@ class RingBufferAudioCapture:
                 "System-audio capture requires a WASAPI output device on Windows."
             )
 
-        device_info = sd.query_devices(device_index)
+        device_info = self._devices_cache[device_index]
         output_channels = int(device_info.get("max_output_channels", 1))
         stream_channels = max(1, min(2, output_channels))
         errors: list[str] = []
 
-        # Newer/alternative backends may expose loopback as InputStream(loopback=True).
-        input_stream_params = inspect.signature(sd.InputStream).parameters
-        if "loopback" in input_stream_params:
+        # Newer/alternative backends may expose loopback as RawInputStream(loopback=True).
+        if _RAW_INPUT_STREAM_HAS_LOOPBACK:
             try:
-                self._stream = sd.InputStream(
+                self._stream = sd.RawInputStream(
                     device=device_index,
                     samplerate=self.sample_rate,
                     channels=stream_channels,
-                    dtype="float32",
+                    dtype="int16",
                     callback=self._audio_callback,
+                    **self._stream_timing(device_index, self.sample_rate),
                     loopback=True,  # type: ignore[arg-type]
                 )
+                self._set_stream_sample_rate(self.sample_rate)
                 self._stream.start()
-                self._stream_sample_rate = float(self.sample_rate)
                 return
             except Exception as exc:
-                errors.append(f"InputStream(loopback=True): {exc}")
+                errors.append(f"RawInputStream(loopback=True): {exc}")
 
         # Some builds exposed loopback via WasapiSettings(loopback=True).
-        try:
-            self._stream = sd.InputStream(
-                device=device_index,
-                samplerate=self.sample_rate,
-                channels=stream_channels,
-                dtype="float32",
-                callback=self._audio_callback,
-                extra_settings=sd.WasapiSettings(loopback=True),  # type: ignore[call-arg]
-            )
-            self._stream.start()
-            self._stream_sample_rate = float(self.sample_rate)
-            return
-        except Exception as exc:
-            errors.append(f"WasapiSettings(loopback=True): {exc}")
+        if _WASAPI_SETTINGS_HAS_LOOPBACK:
+            try:
+                self._stream = sd.RawInputStream(
+                    device=device_index,
+                    samplerate=self.sample_rate,
+                    channels=stream_channels,
+                    dtype="int16",
+                    callback=self._audio_callback,
+                    **self._stream_timing(device_index, self.sample_rate),
+                    extra_settings=sd.WasapiSettings(loopback=True),  # type: ignore[call-arg]
+                )
+                self._set_stream_sample_rate(self.sample_rate)
+                self._stream.start()
+                return
+            except Exception as exc:
+                errors.append(f"WasapiSettings(loopback=True): {exc}")
 
         # Fallback for builds without explicit loopback flag support.
-        try:
-            self._stream = sd.InputStream(
-                device=device_index,
-                samplerate=self.sample_rate,
-                channels=stream_channels,
-                dtype="float32",
-                callback=self._audio_callback,
-                extra_settings=sd.WasapiSettings(exclusive=False, auto_convert=True),
-            )
-            self._stream.start()
-            self._stream_sample_rate = float(self.sample_rate)
-            return
-        except Exception as exc:
-            errors.append(f"WasapiSettings(auto_convert=True): {exc}")
+        if _HAS_WASAPI_SETTINGS:
+            try:
+                self._stream = sd.RawInputStream(
+                    device=device_index,
+                    samplerate=self.sample_rate,
+                    channels=stream_channels,
+                    dtype="int16",
+                    callback=self._audio_callback,
+                    **self._stream_timing(device_index, self.sample_rate),
+                    extra_settings=sd.WasapiSettings(exclusive=False, auto_convert=True),
+                )
+                self._set_stream_sample_rate(self.sample_rate)
+                self._stream.start()
+                return
+            except Exception as exc:
+                errors.append(f"WasapiSettings(auto_convert=True): {exc}")
 
         # Final fallback: use a WASAPI input capture device (e.g. Stereo Mix/virtual cable).
         fallback_input_index = self._resolve_system_audio_input_fallback()
         if fallback_input_index is not None:
             try:
-                fallback_info = sd.query_devices(fallback_input_index)
+                fallback_info = self._devices_cache[fallback_input_index]
                 fallback_channels = max(1, min(2, int(fallback_info.get("max_input_channels", 1))))
                 fallback_default_sr = int(round(float(fallback_info.get("default_samplerate", self.sample_rate))))
                 candidate_sample_rates = [self.sample_rate]
@@ -148,15 +240,16 @@ class RingBufferAudioCapture:
 
                 for candidate_sr in candidate_sample_rates:
                     try:
-                        self._stream = sd.InputStream(
+                        self._stream = sd.RawInputStream(
                             device=fallback_input_index,
                             samplerate=candidate_sr,
                             channels=fallback_channels,
-                            dtype="float32",
+                            dtype="int16",
                             callback=self._audio_callback,
+                            **self._stream_timing(fallback_input_index, candidate_sr),
                         )
+                        self._set_stream_sample_rate(candidate_sr)
                         self._stream.start()
-                        self._stream_sample_rate = float(candidate_sr)
                         return
                     except Exception as exc:
                         errors.append(
@@ -172,8 +265,32 @@ class RingBufferAudioCapture:
             f"cable/Voicemeeter Out) for System Audio. Details: {joined}"
         )
 
+    def _stream_timing(self, device_index: int | None, samplerate: float) -> dict[str, Any]:
+        # Pin the callback cadence to the device's low-latency figure instead of the
+        # host API default, which can be as coarse as ~200 ms on MME.
+        info: dict = {}
+        if device_index is not None and 0 <= device_index < len(self._devices_cache):
+            info = self._devices_cache[device_index]
+        latency = float(info.get("default_low_input_latency", 0.0) or 0.0)
+        if latency <= 0:
+            # Output devices opened for loopback only report an output latency.
+            latency = float(info.get("default_low_output_latency", 0.0) or 0.0)
+        if latency <= 0:
+            latency = _FALLBACK_LOW_LATENCY_S
+        blocksize = _next_pow2(int(samplerate * latency))
+        blocksize = max(_MIN_BLOCKSIZE, min(blocksize, self._max_blocksize))
+        return {"latency": latency, "blocksize": blocksize}
+
+    def _set_stream_sample_rate(self, rate: float) -> None:
+        self._stream_sample_rate = float(rate)
+        self._needs_resample = (
+            self._stream_sample_rate > 0
+            and abs(self._stream_sample_rate - self.sample_rate) >= 0.5
+        )
+        self._ingest = None
+
     def _resolve_system_audio_input_fallback(self) -> int | None:
-        devices = sd.query_devices()
+        devices = self._devices_cache
         parsed_spec = self._parse_spec(self.system_audio_device)
 
         def is_wasapi(index: int) -> bool:
@@ -182,22 +299,10 @@ class RingBufferAudioCapture:
         def is_input(index: int) -> bool:
             return int(devices[index].get("max_input_channels", 0)) > 0
 
-        def normalized_name(index: int) -> str:
-            return str(devices[index].get("name", "")).strip().casefold()
-
-        keyword_markers = (
-            "stereo mix",
-            "loopback",
-            "what u hear",
-            "monitor",
-            "voicemeeter out",
-            "cable output",
-            "mix out",
-        )
+        names_cf = self._device_names_cf
 
         def is_likely_system_capture(index: int) -> bool:
-            name = normalized_name(index)
-            return any(marker in name for marker in keyword_markers)
+            return _SYSTEM_CAPTURE_NAME_RE.search(names_cf[index]) is not None
 
         # If the user selected a specific input-capture device, honor it.
         if isinstance(parsed_spec, int):
@@ -210,8 +315,8 @@ class RingBufferAudioCapture:
             exact = next(
                 (
                     idx
-                    for idx in range(len(devices))
-                    if is_input(idx) and is_wasapi(idx) and normalized_name(idx) == parsed_lower
+                    for idx in self._name_to_indices.get(parsed_lower, ())
+                    if is_input(idx) and is_wasapi(idx)
                 ),
                 None,
             )
@@ -221,8 +326,8 @@ class RingBufferAudioCapture:
             partial = next(
                 (
                     idx
-                    for idx in range(len(devices))
-                    if is_input(idx) and is_wasapi(idx) and parsed_lower in normalized_name(idx)
+                    for idx, name in enumerate(names_cf)
+                    if parsed_lower in name and is_input(idx) and is_wasapi(idx)
                 ),
                 None,
             )
@@ -240,115 +345,267 @@ class RingBufferAudioCapture:
             self._stream.stop()
             self._stream.close()
             self._stream = None
+        self._devices_cache = []
+        self._hostapis_cache = []
+        self._hostapi_name_cache = {}
+        self._device_names_cf = []
+        self._name_to_indices = {}
+
+    def _refresh_device_cache(self) -> None:
+        self._devices_cache = list(sd.query_devices())
+        self._hostapis_cache = list(sd.query_hostapis())
+        self._hostapi_name_cache = {}
+        self._device_names_cf = [
+            str(device.get("name", "")).strip().casefold() for device in self._devices_cache
+        ]
+        self._name_to_indices = {}
+        for idx, name in enumerate(self._device_names_cf):
+            self._name_to_indices.setdefault(name, []).append(idx)
 
     def begin_recording(self) -> None:
-        with self._lock:
-            self._frozen_prefix = self._read_latest_samples(self.pre_buffer_samples)
-            self._recording_chunks = []
-            self._recording = True
+        while True:
+            with self._lock:
+                # Raise the flag before snapshotting so a callback that misses it has
+                # already published its block into the prefix. On a retry this also
+                # drops whatever was appended after the stale prefix.
+                self._recording = True
+                total = self._total_written
+                self._record_from = total
+                prefix = self._read_latest_samples(self.pre_buffer_samples, total)
+                prefix_len = prefix.shape[0]
+                self._record_write_pos = 0
+                self._reserve_recording(prefix_len)
+                self._record_write_pos = prefix_len
+                arena = self._record_buf
+
+            # Copy the prefix outside the lock so a recording callback is never held up by it.
+            arena[:prefix_len] = prefix
+            with self._lock:
+                if self._record_buf is not arena:
+                    # The callback grew the arena mid-copy; its carried-over prefix may be partial.
+                    self._record_buf[:prefix_len] = prefix
+            if self._window_intact(total):
+                return
 
     def stop_recording(self) -> np.ndarray:
         with self._lock:
             self._recording = False
-            chunks = [self._frozen_prefix, *self._recording_chunks]
-            self._recording_chunks = []
-            self._frozen_prefix = np.zeros((0, self.channels), dtype=np.float32)
-
-        if not chunks:
-            return np.zeros(0, dtype=np.float32)
-
-        merged = np.concatenate(chunks, axis=0)
-        return merged.reshape(-1).astype(np.float32, copy=False)
-
-    def get_recent_audio(self, max_ms: int | None = None) -> np.ndarray:
+            recorded = self._record_buf[: self._record_write_pos]
+            self._record_write_pos = 0
+
+        return _pcm16_to_float32(recorded.reshape(-1))
+
+    def get_samples_written(self) -> int:
+        # Monotonic frame count; callers compare it across polls to detect new audio.
+        return self._total_written
+
+    def get_pcm16_since(self, since_total: int) -> tuple[np.ndarray, int]:
+        # Samples written after `since_total` (capped at the ring), copied out as int16,
+        # plus the counter to pass back on the next call.
+        while True:
+            total = self._total_written
+            sample_count = min(max(0, total - since_total), self.ring_buffer_samples)
+            pcm = self._read_latest_samples(sample_count, total).reshape(-1).copy()
+            if self._window_intact(total):
+                return pcm, total
+
+    def get_recent_audio(self, max_ms: int | None = None, out: np.ndarray | None = None) -> np.ndarray:
         if max_ms is None:
             sample_count = self.ring_buffer_samples
         else:
             sample_count = max(1, int(self.sample_rate * max_ms / 1000))
-        with self._lock:
-            block = self._read_latest_samples(sample_count)
-        return block.reshape(-1).astype(np.float32, copy=False)
+        # Widen straight out of the ring view; the float32 result is the only copy made,
+        # and with `out` (a caller-owned float32 scratch) not even that is allocated.
+        while True:
+            total = self._total_written
+            latest = self._read_latest_samples(sample_count, total).reshape(-1)
+            if out is not None and out.size >= latest.size:
+                audio = _pcm16_to_float32(latest, out=out[: latest.size])
+            else:
+                audio = _pcm16_to_float32(latest)
+            if self._window_intact(total):
+                return audio
+
+    def get_recent_rms(self, max_ms: int) -> float:
+        # Sum of squares straight off the int16 ring view, accumulated in int64, so the
+        # silence monitor's polls allocate nothing.
+        sample_count = max(1, int(self.sample_rate * max_ms / 1000))
+        while True:
+            total = self._total_written
+            latest = self._read_latest_samples(sample_count, total).reshape(-1)
+            if latest.size == 0:
+                return 0.0
+            energy = int(np.einsum("i,i->", latest, latest, dtype=np.int64))
+            if self._window_intact(total):
+                return math.sqrt(energy / latest.size) * _PCM16_SCALE
 
     def _audio_callback(self, indata, frames, _time, status) -> None:
-        if status:
-            # Keep service running; callback status is transient on some devices.
-            pass
+        # Callback status is transient on some devices; keep the service running.
+        ingest = self._ingest
+        if ingest is None or frames != self._ingest_frames:
+            ingest = self._build_ingest(indata, frames)
+        ingest(indata)
 
-        block = np.array(indata, copy=True, dtype=np.float32)
-        if block.ndim == 1:
-            block = block.reshape(-1, 1)
-        elif block.shape[1] != 1:
-            block = block.mean(axis=1, keepdims=True, dtype=np.float32)
-        block = self._resample_to_target_rate(block)
+    def _build_ingest(self, indata, frames: int) -> Callable[[Any], None]:
+        # The block layout is fixed for the life of a stream, so pick a straight-line body
+        # once instead of re-checking channels and resampling on every callback.
+        channels = np.frombuffer(indata, dtype=np.int16).size // max(1, frames)
+        frombuffer = np.frombuffer
+        int16 = np.int16
+        downmix = self._downmix
+        resample = self._resample_to_target_rate
+        publish = self._publish_block
 
-        with self._lock:
-            self._write_ring(block)
-            if self._recording:
-                self._recording_chunks.append(block)
+        # RawInputStream hands us the PortAudio buffer itself (a CFFI buffer object), so
+        # each view is zero-copy and only valid for the duration of the callback.
+        if channels <= 1 and not self._needs_resample:
 
-    def _resample_to_target_rate(self, block: np.ndarray) -> np.ndarray:
-        src_rate = float(self._stream_sample_rate)
-        dst_rate = float(self.sample_rate)
-        if src_rate <= 0 or abs(src_rate - dst_rate) < 0.5:
-            return block
-        if block.shape[0] <= 1:
-            return block
+            def ingest(data) -> None:
+                publish(frombuffer(data, dtype=int16).reshape(frames, 1))
 
-        target_frames = max(1, int(round(block.shape[0] * dst_rate / src_rate)))
-        if target_frames == block.shape[0]:
-            return block
+        elif channels <= 1:
 
-        x_old = np.linspace(0.0, 1.0, num=block.shape[0], endpoint=False, dtype=np.float32)
-        x_new = np.linspace(0.0, 1.0, num=target_frames, endpoint=False, dtype=np.float32)
-        resampled = np.interp(x_new, x_old, block[:, 0]).astype(np.float32, copy=False)
-        return resampled.reshape(-1, 1)
+            def ingest(data) -> None:
+                publish(resample(frombuffer(data, dtype=int16).reshape(frames, 1)))
 
-    def _write_ring(self, block: np.ndarray) -> None:
-        frames = block.shape[0]
-        if frames >= self.ring_buffer_samples:
-            self._ring[:] = block[-self.ring_buffer_samples :]
-            self._write_idx = 0
-            self._filled = self.ring_buffer_samples
-            return
+        elif not self._needs_resample:
+
+            def ingest(data) -> None:
+                publish(downmix(frombuffer(data, dtype=int16).reshape(frames, channels)))
 
-        end = self._write_idx + frames
-        if end <= self.ring_buffer_samples:
-            self._ring[self._write_idx : end] = block
         else:
-            first = self.ring_buffer_samples - self._write_idx
-            self._ring[self._write_idx :] = block[:first]
-            self._ring[: end % self.ring_buffer_samples] = block[first:]
 
-        self._write_idx = end % self.ring_buffer_samples
-        self._filled = min(self.ring_buffer_samples, self._filled + frames)
+            def ingest(data) -> None:
+                publish(resample(downmix(frombuffer(data, dtype=int16).reshape(frames, channels))))
+
+        self._ingest = ingest
+        self._ingest_frames = frames
+        return ingest
+
+    def _publish_block(self, block: np.ndarray) -> None:
+        start_total = self._total_written
+        self._write_ring(block, start_total)
+        self._total_written = start_total + block.shape[0]
+
+        if self._recording:
+            with self._lock:
+                if self._recording:
+                    # Samples up to _record_from were already copied in as the prefix.
+                    skip = max(0, self._record_from - start_total)
+                    if skip < block.shape[0]:
+                        self._append_recording(block[skip:])
+
+    def _downmix(self, block: np.ndarray) -> np.ndarray:
+        frames, channels = block.shape
+        scratch = self._downmix_scratch
+        if scratch is None or scratch.shape[0] < frames:
+            scratch = np.empty((frames, 1), dtype=np.int32)
+            self._downmix_scratch = scratch
+            self._downmix_out = np.empty((frames, 1), dtype=np.int16)
+        # Buffers are reused across callbacks; the ring and recording writes copy out of them.
+        acc = scratch[:frames]
+        out = self._downmix_out[:frames]
+        if channels == 2:
+            np.add(block[:, 0:1], block[:, 1:2], out=acc, dtype=np.int32)
+            np.right_shift(acc, 1, out=out)
+            return out
+        np.sum(block, axis=1, keepdims=True, dtype=np.int32, out=acc)
+        np.floor_divide(acc, channels, out=out)
+        return out
+
+    def _append_recording(self, block: np.ndarray) -> None:
+        start = self._record_write_pos
+        end = start + block.shape[0]
+        self._reserve_recording(end)
+        self._record_buf[start:end] = block
+        self._record_write_pos = end
+
+    def _reserve_recording(self, size: int) -> None:
+        capacity = self._record_buf.shape[0]
+        if size <= capacity:
+            return
+        grown = np.empty((max(2 * capacity, size), self.channels), dtype=np.int16)
+        written = self._record_write_pos
+        grown[:written] = self._record_buf[:written]
+        self._record_buf = grown
 
-    def _read_ring_buffer(self) -> np.ndarray:
-        if self._filled == 0:
-            return np.zeros((0, self.channels), dtype=np.float32)
+    def _resample_to_target_rate(self, block: np.ndarray) -> np.ndarray:
+        frames = block.shape[0]
+        if frames <= 1:
+            return block
 
-        if self._filled < self.ring_buffer_samples:
-            return np.array(self._ring[: self._filled], copy=True)
+        table = self._resample_tables.get(frames)
+        if table is None:
+            table = self._build_resample_table(
+                frames,
+                self._stream_sample_rate,
+                float(self.sample_rate),
+            )
+            self._resample_tables[frames] = table
+        idx, idx_next, frac, out, upper, work = table
+        if out.shape[0] == frames:
+            return block
 
-        if self._write_idx == 0:
-            return np.array(self._ring, copy=True)
+        samples = block[:, 0]
+        np.take(samples, idx, out=out)
+        np.take(samples, idx_next, out=upper)
+        np.subtract(upper, out, out=work, dtype=np.float32)
+        np.multiply(work, frac, out=work)
+        np.add(work, out, out=work)
+        np.rint(work, out=work)
+        np.copyto(out, work, casting="unsafe")
+        return out.reshape(-1, 1)
 
-        return np.concatenate(
-            (
-                self._ring[self._write_idx :],
-                self._ring[: self._write_idx],
-            ),
-            axis=0,
-        ).copy()
+    @staticmethod
+    def _build_resample_table(
+        frames: int,
+        src_rate: float,
+        dst_rate: float,
+    ) -> _ResampleTable:
+        target_frames = max(1, int(round(frames * dst_rate / src_rate)))
+        positions = np.arange(target_frames, dtype=np.float64) * (frames / target_frames)
+        idx = np.floor(positions).astype(np.intp)
+        idx_next = np.minimum(idx + 1, frames - 1)
+        frac = (positions - idx).astype(np.float32)
+        out = np.empty(target_frames, dtype=np.int16)
+        upper = np.empty(target_frames, dtype=np.int16)
+        work = np.empty(target_frames, dtype=np.float32)
+        return idx, idx_next, frac, out, upper, work
+
+    def _write_ring(self, block: np.ndarray, start_total: int) -> None:
+        backing = self._ring_backing
+        capacity = self._ring_capacity
+        samples = block.reshape(-1)
+        frames = samples.shape[0]
+        if frames > capacity:
+            samples = samples[-capacity:]
+            start_total += frames - capacity
+            frames = capacity
+
+        write_idx = start_total % capacity
+        end = write_idx + frames
+        backing[write_idx:end] = samples
+        # Keep the mirror half in sync with what was just written.
+        if end <= capacity:
+            backing[write_idx + capacity : end + capacity] = samples
+            return
+        first = capacity - write_idx
+        backing[write_idx + capacity :] = samples[:first]
+        backing[: end - capacity] = samples[first:]
 
-    def _read_latest_samples(self, sample_count: int) -> np.ndarray:
-        if self._filled == 0:
-            return np.zeros((0, self.channels), dtype=np.float32)
+    def _window_intact(self, total: int) -> bool:
+        # A window read at `total` stays valid until the writer (plus one in-flight block)
+        # reaches its oldest slot; callers re-read when a stall let it get that far.
+        return self._total_written - total <= self._ring_headroom
 
-        ordered = self._read_ring_buffer()
-        take = min(sample_count, ordered.shape[0])
-        if take <= 0:
-            return np.zeros((0, self.channels), dtype=np.float32)
-        return np.array(ordered[-take:], copy=True)
+    def _read_ring_buffer(self, total: int) -> np.ndarray:
+        filled = min(total, self.ring_buffer_samples)
+        start_idx = (total - filled) % self._ring_capacity
+        return self._ring_backing[start_idx : start_idx + filled].reshape(-1, 1)
+
+    def _read_latest_samples(self, sample_count: int, total: int) -> np.ndarray:
+        ordered = self._read_ring_buffer(total)
+        return ordered[max(0, ordered.shape[0] - sample_count) :]
 
     def _resolve_device_index(
         self,
@@ -359,7 +616,7 @@ class RingBufferAudioCapture:
     ) -> int | None:
         parsed = self._parse_spec(spec)
         if isinstance(parsed, int):
-            devices = sd.query_devices()
+            devices = self._devices_cache
             if not (0 <= parsed < len(devices)):
                 return None
             device = devices[parsed]
@@ -372,7 +629,7 @@ class RingBufferAudioCapture:
             return parsed
 
         candidates: list[tuple[int, dict]] = []
-        devices = sd.query_devices()
+        devices = self._devices_cache
         for idx, device in enumerate(devices):
             max_input = int(device.get("max_input_channels", 0))
             max_output = int(device.get("max_output_channels", 0))
@@ -383,11 +640,13 @@ class RingBufferAudioCapture:
             candidates.append((idx, device))
 
         if parsed is not None:
+            parsed_lower = parsed.casefold()
+            candidate_indices = {idx for idx, _device in candidates}
             exact = next(
                 (
                     idx
-                    for idx, device in candidates
-                    if str(device.get("name", "")).strip().casefold() == parsed.casefold()
+                    for idx in self._name_to_indices.get(parsed_lower, ())
+                    if idx in candidate_indices
                 ),
                 None,
             )
@@ -397,8 +656,8 @@ class RingBufferAudioCapture:
             partial = next(
                 (
                     idx
-                    for idx, device in candidates
-                    if parsed.casefold() in str(device.get("name", "")).casefold()
+                    for idx, _device in candidates
+                    if parsed_lower in self._device_names_cf[idx]
                 ),
                 None,
             )
@@ -434,11 +693,14 @@ class RingBufferAudioCapture:
             return int(stripped)
         return stripped
 
-    @staticmethod
-    def _hostapi_name_for_device(device_index: int) -> str:
-        device = sd.query_devices(device_index)
-        hostapi_index = int(device.get("hostapi", -1))
-        hostapis = sd.query_hostapis()
-        if 0 <= hostapi_index < len(hostapis):
-            return str(hostapis[hostapi_index].get("name", "Unknown"))
-        return "Unknown"
+    def _hostapi_name_for_device(self, device_index: int) -> str:
+        cached = self._hostapi_name_cache.get(device_index)
+        if cached is not None:
+            return cached
+        name = "Unknown"
+        if 0 <= device_index < len(self._devices_cache):
+            hostapi_index = int(self._devices_cache[device_index].get("hostapi", -1))
+            if 0 <= hostapi_index < len(self._hostapis_cache):
+                name = str(self._hostapis_cache[hostapi_index].get("name", "Unknown"))
+        self._hostapi_name_cache[device_index] = name
+        return name
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -15,6 +17,9 @@ class ServiceConfig:
     model_name: str
     model_dir: Path
     compute_type: str
+    worker_threads: int
+    cpu_threads: int
+    num_workers: int
     transcription_language: str
     trigger_mode: str
     wake_word: str
@@ -26,69 +31,82 @@ class ServiceConfig:
     wake_silence_rms_threshold: float
     wake_silence_start_grace_ms: int
     wake_match_threshold: float
+    wake_word_model: str | None
+    wake_word_model_threshold: float
     capture_source: str
     input_device: str | None
     system_audio_device: str | None
 
 
-def _appdata_dir() -> Path:
-    appdata = os.getenv("APPDATA")
+def appdata_dir(env: Mapping[str, str]) -> str:
+    appdata = env.get("APPDATA")
     if appdata:
-        return Path(appdata)
-    return Path.home() / "AppData" / "Roaming"
+        return appdata
+    return os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
 
 
-def _nullable_env(name: str) -> str | None:
-    value = os.getenv(name)
+def _nullable_env(env: Mapping[str, str], name: str) -> str | None:
+    value = env.get(name)
     if value is None:
         return None
     trimmed = value.strip()
     return trimmed if trimmed else None
 
 
-def _wake_silence_sensitivity() -> str:
-    raw = os.getenv("PROMPTFLUX_WAKE_SILENCE_SENSITIVITY", "medium").strip().lower()
+def _wake_silence_sensitivity(env: Mapping[str, str]) -> str:
+    raw = env.get("PROMPTFLUX_WAKE_SILENCE_SENSITIVITY", "medium").strip().lower()
     if raw in {"low", "medium", "high"}:
         return raw
     return "medium"
 
 
+# The service's environment is fixed at spawn (settings changes restart the process),
+# so build the config once and hand out the same frozen instance afterwards.
+@lru_cache(maxsize=1)
 def load_config() -> ServiceConfig:
-    default_model_dir = _appdata_dir() / "promptflux" / "models" / "small-int8"
-    wake_silence_sensitivity = _wake_silence_sensitivity()
+    env = dict(os.environ)
+    model_dir = env.get("PROMPTFLUX_MODEL_DIR")
+    if model_dir is None:
+        model_dir = os.path.join(appdata_dir(env), "promptflux", "models", "small-int8")
+    wake_silence_sensitivity = _wake_silence_sensitivity(env)
     wake_threshold_default_by_sensitivity = {
         "low": "0.006",
         "medium": "0.004",
         "high": "0.0025",
     }
     return ServiceConfig(
-        host=os.getenv("PROMPTFLUX_STT_HOST", "127.0.0.1"),
-        port=int(os.getenv("PROMPTFLUX_STT_PORT", "9876")),
-        sample_rate=int(os.getenv("PROMPTFLUX_SAMPLE_RATE", "16000")),
-        channels=int(os.getenv("PROMPTFLUX_CHANNELS", "1")),
-        pre_buffer_ms=int(os.getenv("PROMPTFLUX_PRE_BUFFER_MS", "500")),
-        model_name=os.getenv("PROMPTFLUX_MODEL_NAME", "small"),
-        model_dir=Path(os.getenv("PROMPTFLUX_MODEL_DIR", str(default_model_dir))),
-        compute_type=os.getenv("PROMPTFLUX_COMPUTE_TYPE", "int8"),
-        transcription_language=os.getenv("PROMPTFLUX_TRANSCRIPTION_LANGUAGE", "auto"),
-        trigger_mode=os.getenv("PROMPTFLUX_TRIGGER_MODE", "hold-to-talk"),
-        wake_word=os.getenv("PROMPTFLUX_WAKE_WORD", "hey promptflux").strip().lower(),
-        wake_poll_ms=int(os.getenv("PROMPTFLUX_WAKE_POLL_MS", "1400")),
-        wake_cooldown_ms=int(os.getenv("PROMPTFLUX_WAKE_COOLDOWN_MS", "4500")),
-        wake_buffer_ms=int(os.getenv("PROMPTFLUX_WAKE_BUFFER_MS", "1800")),
-        wake_silence_ms=int(os.getenv("PROMPTFLUX_WAKE_SILENCE_MS", "1200")),
+        host=env.get("PROMPTFLUX_STT_HOST", "127.0.0.1"),
+        port=int(env.get("PROMPTFLUX_STT_PORT", "9876")),
+        sample_rate=int(env.get("PROMPTFLUX_SAMPLE_RATE", "16000")),
+        channels=int(env.get("PROMPTFLUX_CHANNELS", "1")),
+        pre_buffer_ms=int(env.get("PROMPTFLUX_PRE_BUFFER_MS", "500")),
+        model_name=env.get("PROMPTFLUX_MODEL_NAME", "small"),
+        model_dir=Path(model_dir),
+        compute_type=env.get("PROMPTFLUX_COMPUTE_TYPE", "int8"),
+        worker_threads=max(2, int(env.get("PROMPTFLUX_STT_THREADS", "4"))),
+        cpu_threads=max(0, int(env.get("PROMPTFLUX_CPU_THREADS", "0"))),
+        num_workers=max(1, int(env.get("PROMPTFLUX_NUM_WORKERS", "2"))),
+        transcription_language=env.get("PROMPTFLUX_TRANSCRIPTION_LANGUAGE", "auto"),
+        trigger_mode=env.get("PROMPTFLUX_TRIGGER_MODE", "hold-to-talk"),
+        wake_word=env.get("PROMPTFLUX_WAKE_WORD", "hey promptflux").strip().lower(),
+        wake_poll_ms=int(env.get("PROMPTFLUX_WAKE_POLL_MS", "1400")),
+        wake_cooldown_ms=int(env.get("PROMPTFLUX_WAKE_COOLDOWN_MS", "4500")),
+        wake_buffer_ms=int(env.get("PROMPTFLUX_WAKE_BUFFER_MS", "1800")),
+        wake_silence_ms=int(env.get("PROMPTFLUX_WAKE_SILENCE_MS", "1200")),
         wake_silence_sensitivity=wake_silence_sensitivity,
         wake_silence_rms_threshold=float(
-            os.getenv(
+            env.get(
                 "PROMPTFLUX_WAKE_SILENCE_RMS_THRESHOLD",
                 wake_threshold_default_by_sensitivity[wake_silence_sensitivity],
             )
         ),
         wake_silence_start_grace_ms=int(
-            os.getenv("PROMPTFLUX_WAKE_SILENCE_START_GRACE_MS", "1400")
+            env.get("PROMPTFLUX_WAKE_SILENCE_START_GRACE_MS", "1400")
         ),
-        wake_match_threshold=float(os.getenv("PROMPTFLUX_WAKE_MATCH_THRESHOLD", "0.82")),
-        capture_source=os.getenv("PROMPTFLUX_CAPTURE_SOURCE", "microphone"),
-        input_device=_nullable_env("PROMPTFLUX_INPUT_DEVICE"),
-        system_audio_device=_nullable_env("PROMPTFLUX_SYSTEM_AUDIO_DEVICE"),
+        wake_match_threshold=float(env.get("PROMPTFLUX_WAKE_MATCH_THRESHOLD", "0.82")),
+        wake_word_model=_nullable_env(env, "PROMPTFLUX_WAKE_WORD_MODEL"),
+        wake_word_model_threshold=float(env.get("PROMPTFLUX_WAKE_WORD_MODEL_THRESHOLD", "0.5")),
+        capture_source=env.get("PROMPTFLUX_CAPTURE_SOURCE", "microphone"),
+        input_device=_nullable_env(env, "PROMPTFLUX_INPUT_DEVICE"),
+        system_audio_device=_nullable_env(env, "PROMPTFLUX_SYSTEM_AUDIO_DEVICE"),
     )
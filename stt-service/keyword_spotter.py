@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import numpy as np
+
+# openWakeWord scores 80 ms frames of 16 kHz int16 PCM.
+SPOTTER_SAMPLE_RATE = 16000
+_FRAME_SAMPLES = 1280
+
+
+class KeywordSpotter:
+    def __init__(self, model_path: str) -> None:
+        # Optional dependency: only needed when a wake-word model is configured.
+        from openwakeword.model import Model
+
+        framework = "onnx" if model_path.lower().endswith(".onnx") else "tflite"
+        self._model = Model(wakeword_models=[model_path], inference_framework=framework)
+        self._pending = np.empty(0, dtype=np.int16)
+
+    def score(self, samples: np.ndarray) -> float:
+        # Frames are scored in order so the model's streaming state stays continuous;
+        # a partial trailing frame is carried over to the next call.
+        pcm = np.concatenate((self._pending, samples)) if self._pending.size else samples
+        usable = pcm.size - pcm.size % _FRAME_SAMPLES
+        best = 0.0
+        for start in range(0, usable, _FRAME_SAMPLES):
+            scores = self._model.predict(pcm[start : start + _FRAME_SAMPLES])
+            best = max(best, max(scores.values(), default=0.0))
+        self._pending = pcm[usable:].copy()
+        return float(best)
+
+    def reset(self) -> None:
+        self._model.reset()
+        self._pending = np.empty(0, dtype=np.int16)
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import time
+from pathlib import Path
 
-import sounddevice as sd
+from config import appdata_dir
 
+# Listings younger than this are served from disk without initializing PortAudio.
+_CACHE_TTL_S = 30.0
 
-def _hostapi_name(hostapi_index: int) -> str:
-    hostapis = sd.query_hostapis()
-    if 0 <= hostapi_index < len(hostapis):
-        return str(hostapis[hostapi_index].get("name", "Unknown"))
+
+def _cache_path() -> Path:
+    return Path(os.path.join(appdata_dir(os.environ), "promptflux", "cache", "devices.json"))
+
+
+def _read_fresh_cache(path: Path) -> str | None:
+    try:
+        if time.time() - path.stat().st_mtime > _CACHE_TTL_S:
+            return None
+        text = path.read_text(encoding="utf-8")
+        return text if isinstance(json.loads(text), dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path: Path, text: str) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _hostapi_name(hostapi_names: tuple[str, ...], hostapi_index: int) -> str:
+    if 0 <= hostapi_index < len(hostapi_names):
+        return hostapi_names[hostapi_index]
     return "Unknown"
 
 
@@ -17,8 +47,12 @@ def _device_name(device: dict) -> str:
     return name if name else "Unnamed Device"
 
 
-def main() -> None:
+def _build_payload() -> dict:
+    # Importing sounddevice initializes PortAudio, which enumerates every device.
+    import sounddevice as sd
+
     devices = sd.query_devices()
+    hostapi_names = tuple(str(hostapi.get("name", "Unknown")) for hostapi in sd.query_hostapis())
     default_input, default_output = sd.default.device
 
     microphones: list[dict] = []
@@ -27,7 +61,7 @@ def main() -> None:
     wasapi_inputs: list[dict] = []
 
     for index, device in enumerate(devices):
-        hostapi = _hostapi_name(int(device.get("hostapi", -1)))
+        hostapi = _hostapi_name(hostapi_names, int(device.get("hostapi", -1)))
         name = _device_name(device)
 
         max_input = int(device.get("max_input_channels", 0))
@@ -62,11 +96,23 @@ def main() -> None:
                 wasapi_outputs.append(item)
 
     system_audio_devices = wasapi_outputs + wasapi_inputs
-    payload = {
+    return {
         "microphones": microphones,
         "systemAudio": system_audio_devices if system_audio_devices else outputs,
     }
-    print(json.dumps(payload))
+
+
+def main() -> None:
+    cache_path = _cache_path()
+    if "--refresh" not in sys.argv[1:]:
+        cached = _read_fresh_cache(cache_path)
+        if cached is not None:
+            print(cached)
+            return
+
+    text = json.dumps(_build_payload())
+    _write_cache(cache_path, text)
+    print(text)
 
 
 if __name__ == "__main__":
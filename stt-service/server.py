@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-import difflib
 import json
 import logging
 import re
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
 
+import numpy as np
 import websockets
+from rapidfuzz import fuzz, process
 from websockets.server import WebSocketServerProtocol
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from audio import RingBufferAudioCapture
 from config import load_config
-from transcriber import Transcriber
 
 
 logging.basicConfig(
@@ -22,6 +31,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger("promptflux.stt")
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_VOWEL_RE = re.compile(r"[aeiou]")
+_SEND_TIMEOUT_S = 2.0
+_CLIENT_QUEUE_SIZE = 64
+_MAX_CLIENT_FRAME_BYTES = 64 * 1024
+# orjson returns compact UTF-8 bytes (sent as binary frames, which the client decodes
+# the same way) and its JSONDecodeError subclasses the stdlib one; the stdlib fallback
+# is made just as compact.
+_json_dumps: Callable[[Any], str | bytes] = (
+    orjson.dumps if orjson is not None else partial(json.dumps, separators=(",", ":"))
+)
+_json_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
+_MESSAGE_TYPES = frozenset({"START", "STOP", "QUIT"})
+_BYTES_MESSAGE_TYPES = {name.encode("ascii"): name for name in _MESSAGE_TYPES}
+_MAX_CONTROL_FRAME_BYTES = 8
+# Shared read-only payload for frames that carry no fields.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
 
 def _normalize_language(value: Any) -> str | None:
     if value is None:
@@ -34,49 +61,74 @@ def _normalize_language(value: Any) -> str | None:
     return normalized
 
 
-def _parse_message(message: Any) -> tuple[str, dict[str, Any]]:
+def _message_type(value: Any) -> str:
+    # Clients already send the canonical upper-case names, so only fall back to
+    # str()/upper() for anything that isn't one of them verbatim.
+    if isinstance(value, str) and value in _MESSAGE_TYPES:
+        return value
+    return str(value).upper()
+
+
+def _parse_message(message: Any) -> tuple[str, Mapping[str, Any]]:
     if isinstance(message, bytes):
+        # Binary control frames map straight to the protocol names without decoding.
+        if len(message) <= _MAX_CONTROL_FRAME_BYTES:
+            msg_type = _BYTES_MESSAGE_TYPES.get(message.strip())
+            if msg_type is not None:
+                return msg_type, _EMPTY_PAYLOAD
         message = message.decode("utf-8", errors="ignore")
 
     if isinstance(message, str):
+        # Control frames (START/STOP/QUIT) are plain words; only frames that
+        # look like a JSON object go through the decoder.
         stripped = message.strip()
-        if stripped.startswith("{") and stripped.endswith("}"):
-            try:
-                payload = json.loads(stripped)
-                if isinstance(payload, dict):
-                    msg_type = str(payload.get("type", "")).upper()
-                    return msg_type, payload
-                return "", {}
-            except json.JSONDecodeError:
-                return "", {}
-        return stripped.upper(), {}
+        if stripped[:1] != "{" or not stripped.endswith("}"):
+            return _message_type(stripped), _EMPTY_PAYLOAD
+        try:
+            payload = _json_loads(stripped)
+        except json.JSONDecodeError:
+            return "", _EMPTY_PAYLOAD
+        if isinstance(payload, dict):
+            return _message_type(payload.get("type", "")), payload
+        return "", _EMPTY_PAYLOAD
 
     if isinstance(message, dict):
-        return str(message.get("type", "")).upper(), message
+        return _message_type(message.get("type", "")), message
 
-    return "", {}
+    return "", _EMPTY_PAYLOAD
 
 
 def _normalize_phrase(value: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
-    return " ".join(cleaned.split())
+    return " ".join(_NON_ALNUM_RE.sub(" ", value.lower()).split())
 
 
-def _compact_phrase(value: str) -> str:
-    return re.sub(r"\s+", "", _normalize_phrase(value))
+@dataclass(frozen=True)
+class _WakePhrase:
+    normalized: str
+    compact: str
+    skeleton: str
+    token_count: int
 
 
-def _consonant_skeleton(value: str) -> str:
-    compact = _compact_phrase(value)
-    return re.sub(r"[aeiou]", "", compact)
+def _wake_phrase(wake_word: str) -> _WakePhrase:
+    normalized = _normalize_phrase(wake_word)
+    compact = normalized.replace(" ", "")
+    return _WakePhrase(
+        normalized=normalized,
+        compact=compact,
+        skeleton=_VOWEL_RE.sub("", compact),
+        token_count=len(normalized.split()),
+    )
 
 
-def _wake_candidate_compacts(spoken_normalized: str, wake_token_count: int) -> set[str]:
+# Wake polls overlap in audio, so the same transcript tends to come back several times.
+@lru_cache(maxsize=64)
+def _wake_candidate_compacts(spoken_normalized: str, wake_token_count: int) -> frozenset[str]:
     tokens = spoken_normalized.split()
     if not tokens:
-        return set()
+        return frozenset()
 
-    candidates: set[str] = {_compact_phrase(spoken_normalized)}
+    candidates: set[str] = {spoken_normalized.replace(" ", "")}
     if wake_token_count <= 1:
         # Single-word wake phrases are often split ("la vart"), so join short n-grams.
         for i in range(len(tokens)):
@@ -84,49 +136,100 @@ def _wake_candidate_compacts(spoken_normalized: str, wake_token_count: int) -> s
             for j in range(i, min(len(tokens), i + 3)):
                 compact += tokens[j]
                 candidates.add(compact)
-        return candidates
+        return frozenset(candidates)
 
     min_window = max(1, wake_token_count - 1)
     max_window = min(len(tokens), wake_token_count + 1)
     for window_size in range(min_window, max_window + 1):
         for start in range(0, len(tokens) - window_size + 1):
             candidates.add("".join(tokens[start : start + window_size]))
-    return candidates
+    return frozenset(candidates)
 
 
-def _wake_match_score(wake_word: str, spoken_text: str) -> tuple[float, str]:
-    wake_normalized = _normalize_phrase(wake_word)
-    spoken_normalized = _normalize_phrase(spoken_text)
-    if not wake_normalized or not spoken_normalized:
+def _wake_match_score(
+    wake: _WakePhrase,
+    spoken_normalized: str,
+    score_cutoff: float = 0.0,
+) -> tuple[float, str]:
+    # `spoken_normalized` must already be passed through _normalize_phrase.
+    if not wake.normalized or not spoken_normalized:
         return 0.0, ""
 
-    wake_compact = _compact_phrase(wake_word)
-    spoken_compact = _compact_phrase(spoken_text)
-    if wake_normalized in spoken_normalized or wake_compact in spoken_compact:
+    wake_compact = wake.compact
+    if wake.normalized in spoken_normalized or wake_compact in spoken_normalized.replace(" ", ""):
         return 1.0, wake_compact
 
-    wake_tokens = wake_normalized.split()
     target_len = max(1, len(wake_compact))
-    wake_skeleton = _consonant_skeleton(wake_word)
-    best_score = 0.0
-    best_candidate = ""
-    for candidate in _wake_candidate_compacts(spoken_normalized, len(wake_tokens)):
-        if not candidate:
-            continue
-        length_ratio = len(candidate) / target_len
-        if length_ratio < 0.55 or length_ratio > 1.8:
-            continue
-        score = difflib.SequenceMatcher(None, wake_compact, candidate).ratio()
-        if wake_skeleton and wake_skeleton == _consonant_skeleton(candidate):
-            score = max(score, 0.90)
-        if score > best_score:
-            best_score = score
-            best_candidate = candidate
+    candidates = [
+        candidate
+        for candidate in _wake_candidate_compacts(spoken_normalized, wake.token_count)
+        if candidate and 0.55 <= len(candidate) / target_len <= 1.8
+    ]
+    if not candidates:
+        return 0.0, ""
+
+    # With a cutoff rapidfuzz bails out of candidates that cannot reach it (length
+    # and character-overlap bounds) before running the full alignment.
+    best = process.extractOne(
+        wake_compact,
+        candidates,
+        scorer=fuzz.ratio,
+        processor=None,
+        score_cutoff=score_cutoff * 100.0,
+    )
+    if best is None:
+        best_candidate, best_score = "", 0.0
+    else:
+        best_candidate, best_score, _index = best
+        best_score /= 100.0
+    # Candidates are already compact, so only the vowels need stripping; a skeleton
+    # match can't help once the score is past its 0.90 floor.
+    wake_skeleton = wake.skeleton
+    if best_score < 0.90 and wake_skeleton:
+        for candidate in candidates:
+            if len(candidate) >= len(wake_skeleton) and wake_skeleton == _VOWEL_RE.sub("", candidate):
+                return 0.90, candidate
     return best_score, best_candidate
 
 
+def _speech_region(
+    audio: np.ndarray,
+    sample_rate: int,
+    rms_threshold: float,
+    margin_ms: int,
+    min_active_frames: int,
+) -> np.ndarray | None:
+    # Energy endpointing on 10 ms frames. Returns None when too few frames are
+    # voiced (a click or pop can lift the window RMS on its own), otherwise the
+    # active span plus a margin so word edges aren't clipped.
+    hop = max(1, sample_rate // 100)
+    frame_count = audio.size // hop
+    if frame_count == 0:
+        return None
+    frames = audio[: frame_count * hop].reshape(frame_count, hop)
+    energy = np.einsum("ij,ij->i", frames, frames) / hop
+    active = np.flatnonzero(energy >= rms_threshold * rms_threshold)
+    if active.size < min_active_frames:
+        return None
+    margin = int(sample_rate * margin_ms / 1000)
+    start = max(0, int(active[0]) * hop - margin)
+    end = min(audio.size, (int(active[-1]) + 1) * hop + margin)
+    return audio[start:end]
+
+
+def _enqueue_frame(queue: asyncio.Queue[str | bytes], frame: str | bytes) -> None:
+    # A client that falls this far behind loses its oldest frames, not the newest.
+    try:
+        queue.put_nowait(frame)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(frame)
+
+
 class PromptFluxSttService:
     def __init__(self) -> None:
+        from transcriber import Transcriber
+
         self.config = load_config()
         self.audio = RingBufferAudioCapture(
             sample_rate=self.config.sample_rate,
@@ -141,27 +244,75 @@ class PromptFluxSttService:
             model_dir=self.config.model_dir,
             model_name=self.config.model_name,
             compute_type=self.config.compute_type,
+            cpu_threads=self.config.cpu_threads,
+            num_workers=self.config.num_workers,
         )
         self.shutdown_event = asyncio.Event()
-        self.clients: set[WebSocketServerProtocol] = set()
+        # Each client gets an outbound queue drained by its own relay task, so
+        # producers never wait on a slow socket.
+        self.clients: dict[WebSocketServerProtocol, asyncio.Queue[str | bytes]] = {}
         self.recording_active = False
         self.transcribing_active = False
         self.last_wake_time = 0.0
         self.wake_task: asyncio.Task | None = None
         self.silence_stop_task: asyncio.Task | None = None
+        self.model_task: asyncio.Task | None = None
+        self.model_error: Exception | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        # Handlers return True when the client session should end.
+        self._message_handlers: dict[
+            str, Callable[[WebSocketServerProtocol, Mapping[str, Any]], Awaitable[bool]]
+        ] = {
+            "START": self._on_start,
+            "STOP": self._on_stop,
+            "QUIT": self._on_quit,
+        }
 
     async def send_message(self, ws: WebSocketServerProtocol, event: str, payload: dict) -> None:
-        await ws.send(json.dumps({"type": event, **payload}))
+        frame = _json_dumps({"type": event, **payload})
+        queue = self.clients.get(ws)
+        if queue is None:
+            await ws.send(frame)
+            return
+        _enqueue_frame(queue, frame)
+
+    def _queue_message(self, ws: WebSocketServerProtocol, event: str, payload: dict) -> None:
+        # Fire-and-forget variant for loop callbacks; frames for departed clients are dropped.
+        queue = self.clients.get(ws)
+        if queue is not None:
+            _enqueue_frame(queue, _json_dumps({"type": event, **payload}))
+
+    async def _send_frame(self, client: WebSocketServerProtocol, frame: str | bytes) -> bool:
+        try:
+            await asyncio.wait_for(client.send(frame), _SEND_TIMEOUT_S)
+        except websockets.ConnectionClosed:
+            return False
+        except asyncio.TimeoutError:
+            # A cancelled send may leave a partial frame on the wire, so the
+            # connection can't be reused; close it in the background.
+            logger.warning("Dropping client that stalled on send")
+            close_task = asyncio.create_task(client.close())
+            self._background_tasks.add(close_task)
+            close_task.add_done_callback(self._background_tasks.discard)
+            return False
+        except Exception:
+            logger.exception("Send to client failed")
+            return False
+        return True
+
+    async def _relay(self, ws: WebSocketServerProtocol, queue: asyncio.Queue[str | bytes]) -> None:
+        while True:
+            frame = await queue.get()
+            if not await self._send_frame(ws, frame):
+                self.clients.pop(ws, None)
+                return
 
     async def broadcast_message(self, event: str, payload: dict) -> None:
-        dead_clients: list[WebSocketServerProtocol] = []
-        for client in list(self.clients):
-            try:
-                await self.send_message(client, event, payload)
-            except websockets.ConnectionClosed:
-                dead_clients.append(client)
-        for client in dead_clients:
-            self.clients.discard(client)
+        if not self.clients:
+            return
+        frame = _json_dumps({"type": event, **payload})
+        for queue in self.clients.values():
+            _enqueue_frame(queue, frame)
 
     async def send_error(
         self,
@@ -172,10 +323,7 @@ class PromptFluxSttService:
         await self.send_message(ws, "ERROR", {"code": code, "message": message})
 
     def _recent_rms(self, window_ms: int = 250) -> float:
-        audio = self.audio.get_recent_audio(window_ms)
-        if audio.size == 0:
-            return 0.0
-        return float((audio.astype("float32") ** 2).mean() ** 0.5)
+        return self.audio.get_recent_rms(window_ms)
 
     def _cancel_silence_monitor(self) -> None:
         if self.silence_stop_task:
@@ -237,9 +385,12 @@ class PromptFluxSttService:
             return
 
         wake_word = self.config.wake_word.strip().lower()
-        wake_word_normalized = _normalize_phrase(wake_word)
-        wake_word_compact = _compact_phrase(wake_word)
-        if not wake_word_normalized:
+        if self.config.wake_word_model and await self._keyword_wake_loop(wake_word):
+            return
+
+        wake = _wake_phrase(wake_word)
+        wake_word_compact = wake.compact
+        if not wake.normalized:
             logger.warning("Wake word normalized to empty value; wake detection disabled.")
             return
         wake_match_threshold = min(0.99, max(0.55, float(self.config.wake_match_threshold)))
@@ -248,6 +399,10 @@ class PromptFluxSttService:
             wake_match_threshold = max(wake_match_threshold, 0.90)
         elif len(wake_word_compact) <= 6:
             wake_match_threshold = max(wake_match_threshold, 0.84)
+        # Polls whose window is quieter than this are treated as silence and never
+        # reach Whisper; kept below the silence monitor's floor so soft speech passes.
+        wake_gate_rms = max(0.0008, float(self.config.wake_silence_rms_threshold)) * 0.8
+        min_wake_samples = int(self.config.sample_rate * 0.6)
         poll_s = max(0.25, self.config.wake_poll_ms / 1000.0)
         cooldown_s = max(0.5, self.config.wake_cooldown_ms / 1000.0)
         wake_prompt = f"Wake word: {wake_word}."
@@ -257,6 +412,13 @@ class PromptFluxSttService:
             wake_match_threshold,
         )
 
+        last_polled_samples = -1
+        # Each poll awaits its transcription before the next fetch, so one buffer
+        # can be reused for every wake window.
+        wake_scratch = np.empty(
+            max(1, int(self.config.sample_rate * self.config.wake_buffer_ms / 1000)),
+            dtype=np.float32,
+        )
         while not self.shutdown_event.is_set():
             await asyncio.sleep(poll_s)
             if not self.clients:
@@ -268,9 +430,28 @@ class PromptFluxSttService:
             if now - self.last_wake_time < cooldown_s:
                 continue
 
-            audio = self.audio.get_recent_audio(self.config.wake_buffer_ms)
-            if audio.size < int(self.config.sample_rate * 0.6):
+            # A stalled or paused capture leaves the ring unchanged; don't re-run
+            # Whisper on a window it has already seen.
+            samples_written = self.audio.get_samples_written()
+            if samples_written == last_polled_samples:
+                continue
+            last_polled_samples = samples_written
+            if self._recent_rms(self.config.wake_buffer_ms) < wake_gate_rms:
+                continue
+            audio = self.audio.get_recent_audio(self.config.wake_buffer_ms, out=wake_scratch)
+            if audio.size < min_wake_samples:
                 continue
+            speech = _speech_region(
+                audio,
+                self.config.sample_rate,
+                wake_gate_rms,
+                margin_ms=200,
+                min_active_frames=3,
+            )
+            if speech is None:
+                continue
+            if speech.size >= min_wake_samples:
+                audio = speech
 
             try:
                 text, _meta = await asyncio.to_thread(
@@ -287,7 +468,7 @@ class PromptFluxSttService:
             spoken = _normalize_phrase(text)
             if not spoken:
                 continue
-            match_score, match_candidate = _wake_match_score(wake_word, spoken)
+            match_score, match_candidate = _wake_match_score(wake, spoken, wake_match_threshold)
             if match_score >= wake_match_threshold:
                 self.last_wake_time = now
                 logger.info(
@@ -301,63 +482,135 @@ class PromptFluxSttService:
                     {"wake_word": wake_word, "heard": spoken},
                 )
 
+    async def _keyword_wake_loop(self, wake_word: str) -> bool:
+        # Returns False when the spotter can't be used, so the caller falls back to
+        # Whisper-based detection.
+        from keyword_spotter import SPOTTER_SAMPLE_RATE, KeywordSpotter
+
+        model_path = self.config.wake_word_model
+        if self.config.sample_rate != SPOTTER_SAMPLE_RATE:
+            logger.warning(
+                "Wake-word model needs %d Hz capture; using Whisper wake detection.",
+                SPOTTER_SAMPLE_RATE,
+            )
+            return False
+        try:
+            spotter = await asyncio.to_thread(KeywordSpotter, model_path)
+        except Exception:
+            logger.exception("Wake-word model failed to load; using Whisper wake detection.")
+            return False
+
+        threshold = self.config.wake_word_model_threshold
+        poll_s = max(0.25, self.config.wake_poll_ms / 1000.0)
+        cooldown_s = max(0.5, self.config.wake_cooldown_ms / 1000.0)
+        logger.info(
+            "Wake-word listener enabled with model '%s' (threshold=%.2f)",
+            model_path,
+            threshold,
+        )
+
+        spotted_total = self.audio.get_samples_written()
+        while not self.shutdown_event.is_set():
+            await asyncio.sleep(poll_s)
+            pcm, spotted_total = self.audio.get_pcm16_since(spotted_total)
+            if not self.clients or self.recording_active or self.transcribing_active:
+                continue
+            now = time.monotonic()
+            if now - self.last_wake_time < cooldown_s or pcm.size == 0:
+                continue
+
+            try:
+                score = await asyncio.to_thread(spotter.score, pcm)
+            except Exception:
+                logger.exception("Wake-word model inference failed")
+                continue
+            if score >= threshold:
+                self.last_wake_time = now
+                spotter.reset()
+                logger.info("Wake word detected by model (score=%.2f)", score)
+                await self.broadcast_message(
+                    "WAKE",
+                    {"wake_word": wake_word, "heard": wake_word},
+                )
+        return True
+
+    async def _on_start(self, ws: WebSocketServerProtocol, payload: Mapping[str, Any]) -> bool:
+        if self.recording_active:
+            return False
+        self.recording_active = True
+        self.transcribing_active = False
+        self.audio.begin_recording()
+        start_reason = str(payload.get("reason", "")).strip().lower()
+        if start_reason in {"wake", "tap"}:
+            self._cancel_silence_monitor()
+            self.silence_stop_task = asyncio.create_task(self._silence_stop_monitor())
+        else:
+            self._cancel_silence_monitor()
+        return False
+
+    async def _on_stop(self, ws: WebSocketServerProtocol, payload: Mapping[str, Any]) -> bool:
+        self._cancel_silence_monitor()
+        self.recording_active = False
+        self.transcribing_active = True
+        audio = self.audio.stop_recording()
+        requested_language = _normalize_language(
+            payload.get("language", self.config.transcription_language)
+        )
+        loop = asyncio.get_running_loop()
+
+        def send_partial(segment_text: str) -> None:
+            # Runs on the transcription thread; hand the frame to the loop. Each frame
+            # carries only the new segment; clients append them until RESULT arrives.
+            loop.call_soon_threadsafe(
+                self._queue_message, ws, "RESULT_PARTIAL", {"text": segment_text}
+            )
+
+        try:
+            text, meta = await asyncio.to_thread(
+                self.transcriber.transcribe,
+                audio,
+                self.config.sample_rate,
+                requested_language,
+                on_segment=send_partial,
+            )
+        except Exception as exc:
+            logger.exception("Transcription failed")
+            await self.send_error(ws, "TRANSCRIPTION_FAILED", str(exc))
+            self.transcribing_active = False
+            return False
+
+        self.transcribing_active = False
+        await self.send_message(ws, "RESULT", {"text": text, "meta": meta})
+        return False
+
+    async def _on_quit(self, ws: WebSocketServerProtocol, payload: Mapping[str, Any]) -> bool:
+        logger.info("Quit message received")
+        self._cancel_silence_monitor()
+        self.shutdown_event.set()
+        return True
+
     async def handle_client(self, ws: WebSocketServerProtocol) -> None:
         logger.info("Client connected")
-        self.clients.add(ws)
+        queue: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+        self.clients[ws] = queue
+        relay_task = asyncio.create_task(self._relay(ws, queue))
         await self.send_message(ws, "READY", {})
         try:
             async for raw_message in ws:
                 msg_type, payload = _parse_message(raw_message)
-                if msg_type == "START":
-                    if self.recording_active:
-                        continue
-                    self.recording_active = True
-                    self.transcribing_active = False
-                    self.audio.begin_recording()
-                    start_reason = str(payload.get("reason", "")).strip().lower()
-                    if start_reason in {"wake", "tap"}:
-                        self._cancel_silence_monitor()
-                        self.silence_stop_task = asyncio.create_task(self._silence_stop_monitor())
-                    else:
-                        self._cancel_silence_monitor()
-                    continue
-
-                if msg_type == "STOP":
-                    self._cancel_silence_monitor()
-                    self.recording_active = False
-                    self.transcribing_active = True
-                    audio = self.audio.stop_recording()
-                    requested_language = _normalize_language(
-                        payload.get("language", self.config.transcription_language)
-                    )
-                    try:
-                        text, meta = await asyncio.to_thread(
-                            self.transcriber.transcribe,
-                            audio,
-                            self.config.sample_rate,
-                            requested_language,
-                        )
-                    except Exception as exc:
-                        logger.exception("Transcription failed")
-                        await self.send_error(ws, "TRANSCRIPTION_FAILED", str(exc))
-                        self.transcribing_active = False
-                        continue
-
-                    self.transcribing_active = False
-                    await self.send_message(ws, "RESULT", {"text": text, "meta": meta})
+                handler = self._message_handlers.get(msg_type)
+                if handler is None:
+                    # Only echo the head of the frame; clients can send arbitrarily large ones.
+                    preview = raw_message[:64] if isinstance(raw_message, (str, bytes)) else raw_message
+                    await self.send_error(ws, "UNKNOWN", f"Unsupported message: {preview!r}")
                     continue
-
-                if msg_type == "QUIT":
-                    logger.info("Quit message received")
-                    self._cancel_silence_monitor()
-                    self.shutdown_event.set()
+                if await handler(ws, payload):
                     break
-
-                await self.send_error(ws, "UNKNOWN", f"Unsupported message: {raw_message!r}")
         except websockets.ConnectionClosed:
             logger.info("Client disconnected")
         finally:
-            self.clients.discard(ws)
+            self.clients.pop(ws, None)
+            relay_task.cancel()
             if not self.clients:
                 self._cancel_silence_monitor()
                 self.recording_active = False
@@ -367,7 +620,23 @@ class PromptFluxSttService:
                 except Exception:
                     pass
 
+    async def _load_model(self) -> None:
+        try:
+            await asyncio.to_thread(self.transcriber.load)
+        except Exception as exc:
+            logger.exception("Model failed to load")
+            self.model_error = exc
+            self.shutdown_event.set()
+
     async def run(self) -> None:
+        # Transcriptions and model loading run via asyncio.to_thread; give them a
+        # pool sized for the wake loop plus a STOP rather than one per core.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.config.worker_threads, thread_name_prefix="stt")
+        )
+        # Load the model in the background so clients get READY without
+        # waiting on CTranslate2; the first transcription waits for it if needed.
+        self.model_task = asyncio.create_task(self._load_model())
         self.audio.start()
         logger.info(
             "STT service listening on ws://%s:%s",
@@ -376,7 +645,15 @@ class PromptFluxSttService:
         )
 
         self.wake_task = asyncio.create_task(self.wake_word_loop())
-        async with websockets.serve(self.handle_client, self.config.host, self.config.port):
+        # Loopback control channel with small JSON frames: deflate only costs CPU
+        # and latency here, and nothing legitimate comes close to 64 KiB.
+        async with websockets.serve(
+            self.handle_client,
+            self.config.host,
+            self.config.port,
+            compression=None,
+            max_size=_MAX_CLIENT_FRAME_BYTES,
+        ):
             await self.shutdown_event.wait()
         if self.wake_task:
             self.wake_task.cancel()
@@ -386,6 +663,8 @@ class PromptFluxSttService:
                 pass
         self._cancel_silence_monitor()
         self.audio.close()
+        if self.model_error is not None:
+            raise SystemExit(f"Initialization failed: {self.model_error}") from self.model_error
 
 
 async def _main() -> None:
@@ -401,5 +680,16 @@ async def _main() -> None:
         logger.info("Interrupted")
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    # uvloop has no Windows build, so the packaged service keeps the default
+    # proactor loop; source runs on Linux/macOS pick it up when installed.
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(_main())
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        runner.run(_main())
@@ -1,26 +1,81 @@
 from __future__ import annotations
 
+import importlib.util
+import os
+import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
 
 import numpy as np
-from faster_whisper import WhisperModel
+
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    from faster_whisper.transcribe import Segment
+
+# Clips longer than one Whisper window are split on speech by the batched
+# pipeline and decoded together; shorter ones fit a single window anyway.
+_BATCHED_MIN_SECONDS = 30
+_BATCH_SIZE = 8
 
 
 class Transcriber:
-    def __init__(self, model_dir: Path, model_name: str, compute_type: str) -> None:
-        model_target = str(model_dir) if model_dir.exists() else model_name
-        self._model = WhisperModel(model_target, compute_type=compute_type)
+    def __init__(
+        self,
+        model_dir: Path,
+        model_name: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+    ) -> None:
+        self._model_target = str(model_dir) if model_dir.exists() else model_name
+        self._compute_type = compute_type
+        self._num_workers = max(1, num_workers)
+        # 0 means "split the cores across workers" so concurrent decodes (a wake
+        # poll and a STOP) don't oversubscribe the CPU.
+        self._cpu_threads = cpu_threads or max(1, (os.cpu_count() or 4) // self._num_workers)
+        self._model: WhisperModel | None = None
+        self._pipeline: BatchedInferencePipeline | None = None
+        self._load_lock = threading.Lock()
 
-    def transcribe(
+    def load(self) -> WhisperModel:
+        # faster-whisper pulls in CTranslate2, so both the import and the model
+        # load are deferred until the service is already up.
+        model = self._model
+        if model is None:
+            with self._load_lock:
+                if self._model is None:
+                    # CTranslate2 reads these when its runtime loads; keep its OpenMP/MKL
+                    # pools at the per-worker budget unless the user already pinned them.
+                    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+                        os.environ.setdefault(name, str(self._cpu_threads))
+                    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+                    model = WhisperModel(
+                        self._model_target,
+                        compute_type=self._compute_type,
+                        cpu_threads=self._cpu_threads,
+                        num_workers=self._num_workers,
+                    )
+                    # The pipeline splits long clips with Silero VAD, which needs
+                    # onnxruntime; the packaged build excludes it, so long clips are
+                    # decoded sequentially there.
+                    if importlib.util.find_spec("onnxruntime") is not None:
+                        self._pipeline = BatchedInferencePipeline(model)
+                    self._model = model
+                model = self._model
+        return model
+
+    def transcribe_stream(
         self,
         audio: np.ndarray,
         sample_rate: int,
         language: str | None = None,
         initial_prompt: str | None = None,
-    ) -> tuple[str, dict]:
+    ) -> Iterator[Segment]:
+        # faster-whisper decodes lazily, so segments come out as each window finishes.
         if audio.size == 0:
-            return "", {"avg_logprob": 0.0, "duration_ms": 0}
+            return iter(())
 
         selected_language = None
         if language:
@@ -28,8 +83,19 @@ class Transcriber:
             if normalized and normalized != "auto":
                 selected_language = normalized
 
-        start = time.perf_counter()
-        segments, _ = self._model.transcribe(
+        model = self.load()
+        if audio.size > sample_rate * _BATCHED_MIN_SECONDS and self._pipeline is not None:
+            segments, _ = self._pipeline.transcribe(
+                audio,
+                batch_size=_BATCH_SIZE,
+                beam_size=1,
+                best_of=1,
+                vad_filter=True,
+                language=selected_language,
+                initial_prompt=initial_prompt,
+            )
+            return segments
+        segments, _ = model.transcribe(
             audio,
             beam_size=1,
             best_of=1,
@@ -38,11 +104,30 @@ class Transcriber:
             language=selected_language,
             initial_prompt=initial_prompt,
         )
-        segment_list = list(segments)
-        text = "".join(segment.text for segment in segment_list).strip()
-        avg_logprob = (
-            float(np.mean([s.avg_logprob for s in segment_list])) if segment_list else 0.0
-        )
+        return segments
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+        on_segment: Callable[[str], None] | None = None,
+    ) -> tuple[str, dict]:
+        if audio.size == 0:
+            return "", {"avg_logprob": 0.0, "duration_ms": 0}
+
+        self.load()
+        start = time.perf_counter()
+        parts: list[str] = []
+        total_logprob = 0.0
+        for segment in self.transcribe_stream(audio, sample_rate, language, initial_prompt):
+            parts.append(segment.text)
+            total_logprob += segment.avg_logprob
+            if on_segment is not None:
+                on_segment(segment.text)
+        text = "".join(parts).strip()
+        avg_logprob = total_logprob / len(parts) if parts else 0.0
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         return text, {"avg_logprob": avg_logprob, "duration_ms": duration_ms}